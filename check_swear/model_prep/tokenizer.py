@@ -1,10 +1,20 @@
 import re
-import nltk
-from nltk.tokenize import RegexpTokenizer
-from nltk.stem.snowball import SnowballStemmer
-from nltk.corpus import stopwords
+import functools
 from .words_prep import load_transliteration_dict
 
+_NON_CYRILLIC_RE = re.compile(r'[^а-яё\s]+')
+# runs of 3 and more same characters or anything that is not a russian letter
+_LONG_VOWELS_OR_NON_CYRILLIC_RE = re.compile(r"(.)\1{2,}|[^а-яё\s]+")
+
+
+def _collapse_or_drop(match):
+    "a run keeps one character if it is a letter or a space, the rest is removed"
+    char = match.group(1)
+    if char is None or _NON_CYRILLIC_RE.match(char):
+        return ''
+    return char
+
+
 class ChatTokenization:
     
     """
@@ -32,14 +42,17 @@ class ChatTokenization:
     stemmer : SnowballStemmer or None
         The stemmer instance initialized based on the specified language if stemming is enabled; otherwise, None.
     
-    russian_stopwords : list of str or None
-        A list of stopwords for the specified language if stopword removal is enabled; otherwise, None.
+    russian_stopwords : frozenset of str or None
+        A set of stopwords for the specified language if stopword removal is enabled; otherwise, None.
 
     Methods
     -------
     tokenizer(text):
         Tokenizes the input text after applying transliteration, long vowel handling, stopword removal, unigram deletion, and stemming based on the class configuration.
 
+    tokenize_variants(text):
+        Tokenizes the input text once and returns both the tokens filtered according to the class configuration and the full list of stemmed tokens, with stopwords and unigrams kept.
+
     Examples
     --------
     >>> tokenizer = ChatTokenization()
@@ -67,15 +80,37 @@ class ChatTokenization:
         
         self.language = language
         self.stemming_use = stemming_use
-        self.stemmer = SnowballStemmer(language) if self.stemming_use else None
+        # nltk is imported only by the steps that need it, which keeps
+        # importing the package cheap
+        if self.stemming_use:
+            from nltk.stem.snowball import SnowballStemmer
+            self.stemmer = SnowballStemmer(language)
+        else:
+            self.stemmer = None
+        # chat tokens repeat a lot, so stemming results are memoized
+        self._stem = functools.lru_cache(maxsize=65536)(self.stemmer.stem) if self.stemming_use else None
         self.remove_stopwords = remove_stopwords
         if self.remove_stopwords:
+            from nltk.corpus import stopwords
             self._download_stopwords(language=language)
-            self.russian_stopwords = stopwords.words(language)
+            self.russian_stopwords = frozenset(stopwords.words(language))
         else:
             self.russian_stopwords = None
         self.delete_unigrams = delete_unigrams
         self.long_vowels_handle = long_vowels_handle
+        self._translit_dict = load_transliteration_dict()
+        # multi-letter keys ("sh", "ch", ...) must be replaced before the
+        # single letters they consist of, the rest goes into one translate table
+        self._translit_multi = [
+            (key, value) for (key, value) in self._translit_dict.items()
+            if len(key) > 1
+        ]
+        self._translit_table = str.maketrans({
+            key: value for (key, value) in self._translit_dict.items()
+            if len(key) == 1
+        })
+        # most messages contain none of these letters and need no transliteration
+        self._translit_trigger = frozenset(key[0] for key in self._translit_dict)
         
     
     def tokenizer(self, text):
@@ -83,85 +118,68 @@ class ChatTokenization:
         tokens = self._preprocess(text)
         return tokens
     
+    def tokenize_variants(self, text):
+        letter_tokens = self._common_pipeline(text)
+        (stem, stops, min_len) = self._token_filters()
+        
+        # every token is stemmed once and shared by both variants
+        full_tokens = [stem(token) for token in letter_tokens]
+        filtered_tokens = [
+            stemmed for (token, stemmed) in zip(letter_tokens, full_tokens)
+            if len(token) >= min_len and token not in stops
+        ]
+        return (filtered_tokens, full_tokens)
+    
     def _preprocess(self, text):
+        letter_tokens = self._common_pipeline(text)
+        (stem, stops, min_len) = self._token_filters()
+        
+        # stopwords, unigrams and stemming are applied in a single pass
+        return [
+            stem(token) for token in letter_tokens
+            if len(token) >= min_len and token not in stops
+        ]
+    
+    def _common_pipeline(self, text):
+        "steps shared by every configuration, before filtering and stemming"
         text = text.lower()
         text = self._transliterate(text)
         
-        if self.long_vowels_handle:
-            text = self._delete_long_vowels(text)
-        
         "remove all symbols except for russian letters"
-        letter_tokens = self._get_letters_only(text)
-
-        
-        # stop earlier
-        if self._early_stopping(letter_tokens):
-            return []
-               
-            
-        if self.remove_stopwords:
-            letter_tokens = self._delete_stopwords(letter_tokens)
-        
-        
-        if self.delete_unigrams:
-            letter_tokens = self._delete_unigrams(letter_tokens)
-            
-        if self.stemming_use:
-            letter_tokens = [self.stemmer.stem(token) for token in letter_tokens]
-        
-        return letter_tokens
+        if self.long_vowels_handle:
+            return self._get_letters_only_short_vowels(text)
+        return self._get_letters_only(text)
+    
+    def _token_filters(self):
+        stem = self._stem if self.stemming_use else (lambda token: token)
+        stops = self.russian_stopwords if self.remove_stopwords else frozenset()
+        min_len = 2 if self.delete_unigrams else 1
+        return (stem, stops, min_len)
     
     def _download_stopwords(self, language):
+        import nltk
+        from nltk.corpus import stopwords
         try:
             stopwords.words(language)
         except LookupError:
             nltk.download('stopwords')
     
     def _transliterate(self, text):
-        transliterate_dict = load_transliteration_dict()
-        for (key, value) in transliterate_dict.items():
+        if self._translit_trigger.isdisjoint(text):
+            return text
+        for (key, value) in self._translit_multi:
             text = text.replace(key, value)
+        text = text.translate(self._translit_table)
         return text
     
     def _get_letters_only(self, text):
         # remove all the non-russian langauge
-        # from all the words
-        letter_tokens = [re.sub(r'[^а-яё]', '', word) for word in text.split()]
+        # from all the words in a single scan
+        letter_tokens = _NON_CYRILLIC_RE.sub('', text).split()
         return letter_tokens
     
     
-    def _early_stopping(self, letter_tokens):
-        if not letter_tokens:
-            return True
-        # handle empty string because of the smiles
-        if len(letter_tokens) == 1 and len(letter_tokens[0]) == 0:
-            return True
-        
-        
-            
-    def _delete_long_vowels(self, text):
-        "handling 3 and more same letters in a row"
-        pattern = re.compile(r"(.)\1{2,}")
-        new_text = pattern.sub(r"\1", text)
-        return new_text
-    
-    
-    def _delete_stopwords(self, tokens):
-        new_letter_tokens = [
-            token for token in tokens
-            if token not in self.russian_stopwords
-        ]
-        return new_letter_tokens
-    
-    
-    def _delete_unigrams(self, tokens):
-        new_letter_tokens = [
-            token for token in tokens
-            if len(token) > 1
-        ]
-        return new_letter_tokens
-    
- 
-
-
-    
\ No newline at end of file
+    def _get_letters_only_short_vowels(self, text):
+        "handling 3 and more same letters in a row and non-russian symbols in one scan"
+        letter_tokens = _LONG_VOWELS_OR_NON_CYRILLIC_RE.sub(_collapse_or_drop, text).split()
+        return letter_tokens
@@ -1,12 +1,20 @@
 import json
 from importlib import resources
 
+_CACHE = None
+
+def _load_words():
+    # words.json is read and parsed only once per process
+    global _CACHE
+    if _CACHE is None:
+        with resources.open_text('check_swear.model_prep', 'words.json') as file:
+            _CACHE = json.load(file)
+    return _CACHE
+
 def load_transliteration_dict():
-    with resources.open_text('check_swear.model_prep', 'words.json') as file:
-        translit_dict = json.load(file)["transliteration_dict"]
+    translit_dict = _load_words()["transliteration_dict"]
     return translit_dict
 
 def load_stemmed_words():
-    with resources.open_text('check_swear.model_prep', 'words.json') as file:
-        stemmed_words = json.load(file)["stemmed_words"]
+    stemmed_words = _load_words()["stemmed_words"]
     return stemmed_words
@@ -1,10 +1,21 @@
 import warnings
+import numpy as np
 from .utils import Validate
 from .utils import Preprocess
 from .utils import RegularExpr
 from .utils import vectorizer_load
 from .utils import model_load
-from ..model_prep.tokenizer import ChatTokenization
+from .utils import tokenizer_load
+
+
+def _combine(probabilities, bool_mask):
+    # (p + m/2) / (1 + m/2), computed in place on a single buffer
+    half_mask = np.asarray(bool_mask, dtype=np.float64) * 0.5
+    out = np.add(probabilities, half_mask)
+    half_mask += 1.0
+    out /= half_mask
+    return out
+
 
 class SwearingCheck:
     
@@ -45,8 +56,9 @@ class SwearingCheck:
     output_text_ : list of str
         The preprocessed and tokenized version of the input text.
 
-    stop_words_ : str
-        The concatenated string of stop words used for pattern matching.
+    stop_words_ : list of str
+        The combined list of stemmed stop words used for pattern matching,
+        built when the instance is created.
 
     _strong_pattern, _weak_pattern : compiled regex
         Compiled regular expression patterns derived from the stop words for
@@ -100,8 +112,11 @@ class SwearingCheck:
         self.reg_pred = reg_pred
         self.bins = bins
         self.stop_words = stop_words
-            
-        pass
+        
+        # add new words to stop words, make it an external attribute
+        # and create strong and weak patterns once per instance
+        self.stop_words_ = RegularExpr.concatenate(self.stop_words)
+        (self._strong_pattern, self._weak_pattern) = RegularExpr.get_patterns(self.stop_words_)
     
     def _validate_params(self, **kwargs):
                 
@@ -134,7 +149,7 @@ class SwearingCheck:
     
     def predict(self, input_text, threshold=0.5):
         self.predict_probs = self._get_predict(input_text)
-        preds = list(map(lambda p: 0 if p < threshold else 1, self.predict_probs))
+        preds = (np.asarray(self.predict_probs) >= threshold).astype(np.uint8).tolist()
         return preds
     
     def predict_proba(self, input_text):
@@ -147,29 +162,42 @@ class SwearingCheck:
         # see how the text changes
         self.output_text_ = prep_text
         
-        # add new words to stop words, make it an external attribute
-        # and create strong and weak patterns
-        if not hasattr(self, 'stop_words_'):
-            self.stop_words_ = RegularExpr.concatenate(self.stop_words)
-            (self._strong_pattern, self._weak_pattern) = RegularExpr.get_patterns(self.stop_words_)
+        # repeated messages are processed once, the results are
+        # scattered back to every position afterwards
+        unique_index = {}
+        inverse = np.fromiter(
+            (unique_index.setdefault(string, len(unique_index)) for string in prep_text),
+            dtype=np.intp,
+            count=len(prep_text)
+        )
+        unique_text = list(unique_index)
         
-            
-        tok = ChatTokenization()
-        tokenized_text = [' '.join(tok.tokenizer(string)) for string in prep_text]
+        tok = tokenizer_load()
+        if self.reg_pred:
+            # one tokenizer pass gives the model input (same as the weak form)
+            # and the strongly stemmed form for the regex analysis
+            tokenized_text = [None] * len(unique_text)
+            strong_stemmed_text = [None] * len(unique_text)
+            for (i, string) in enumerate(unique_text):
+                (weak, strong) = tok.tokenize_variants(string)
+                tokenized_text[i] = ' '.join(weak)
+                strong_stemmed_text[i] = ''.join(strong)
+        else:
+            tokenized_text = [' '.join(tok.tokenizer(string)) for string in unique_text]
         
 
         vectorizer = vectorizer_load()
         vec_text = vectorizer.transform(tokenized_text)
         
         model = model_load()
-        probabilities = model.predict_proba(vec_text)[:, 1]
+        probabilities = np.ascontiguousarray(model.predict_proba(vec_text)[:, 1])
         
         
         if self.reg_pred:
-            bool_mask = RegularExpr.analyze(prep_text, self._strong_pattern, self._weak_pattern)  
-            return [(probabilities[i] + bool_mask[i] * 0.5) / (1.0 + bool_mask[i] * 0.5) for i in range(len(probabilities))]
+            bool_mask = RegularExpr.analyze(strong_stemmed_text, tokenized_text, self._strong_pattern, self._weak_pattern)  
+            return _combine(probabilities, bool_mask)[inverse].tolist()
         else:
-            return probabilities
+            return probabilities[inverse]
 
     
     def _text_validation(self, input_text):
@@ -180,8 +208,10 @@ class SwearingCheck:
             return preprocessed_text
 
         elif hasattr(input_text, '__iter__'):
-            # array preprocess
-            if not Validate.array_validation(input_text):
+            # array preprocess, materialized first so that one-shot
+            # iterators are not exhausted by the validation
+            preprocessed_text = Preprocess.array_prep(input_text)
+            if not Validate.array_validation(preprocessed_text):
                 raise TypeError("All elements must be strings.")
             
             if not self.bins is None:
@@ -189,7 +219,6 @@ class SwearingCheck:
                     "If a string array is passed, bins parameter will be ignored."
                 )
                 
-            preprocessed_text = Preprocess.array_prep(input_text)
             return preprocessed_text
         else:
             raise TypeError(
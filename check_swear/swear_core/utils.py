@@ -1,10 +1,15 @@
 import warnings
 import re
+import functools
 import joblib
+import numpy as np
 from importlib import resources
 from ..model_prep.words_prep import load_stemmed_words
 from ..model_prep.tokenizer import ChatTokenization
 
+# the tokenizer is shared between calls, created on first use
+_DEFAULT_TOK = None
+
 class Validate:
     
     """
@@ -38,12 +43,7 @@ class Validate:
     
     @staticmethod
     def array_validation(input_text):       
-        if input_text is None:
-            return True
-        for string in input_text:
-            if not isinstance(string, str):
-                return False
-        return True
+        return input_text is None or all(isinstance(string, str) for string in input_text)
          
             
 class Preprocess:
@@ -69,19 +69,21 @@ class Preprocess:
         
         split_str = input_text.split()
         str_len = len(split_str)
-        bin_step = str_len // bins
-        
-        text_arr = [' '.join(split_str[i * bin_step: min((i + 1) * bin_step, str_len)]) for i in range(bins)]
-        remaining_words = str_len % bins
+        bin_step, remaining_words = divmod(str_len, bins)
         
-        if remaining_words > 0:
-            text_arr[-1] += ' ' + ' '.join(split_str[-remaining_words:])
+        # the remaining words are spread one per bin over the last bins
+        text_arr = []
+        start = 0
+        for i in range(bins):
+            end = start + bin_step + (1 if i >= bins - remaining_words else 0)
+            text_arr.append(' '.join(split_str[start:end]))
+            start = end
         
         return text_arr
     
     @staticmethod
     def array_prep(input_text):
-        text_arr = [i for i in iter(input_text)]
+        text_arr = input_text if isinstance(input_text, list) else list(input_text)
         return text_arr
 
 
@@ -93,9 +95,9 @@ class RegularExpr:
 
     Methods
     -------
-    analyze(input_text, strong_pattern, weak_pattern):
-        Applies strong and weak pattern matching to input text and returns a
-        boolean mask indicating matches.
+    analyze(strong_stemmed_text, weak_stemmed_text, strong_pattern, weak_pattern):
+        Applies strong and weak pattern matching to pre-tokenized text and
+        returns a uint8 array counting the matches (0, 1 or 2) per string.
 
     concatenate(stop_words):
         Combines a list of stop words with a preloaded list, preparing it for
@@ -107,49 +109,89 @@ class RegularExpr:
     """
     
     @staticmethod
-    def analyze(input_text, strong_pattern, weak_pattern):
-        # strong stemmatization
-        stok = ChatTokenization(remove_stopwords=False, delete_unigrams=False)
-        strong_stemmed_input_text = list(map(lambda string: ''.join(stok.tokenizer(string)), input_text))
-        
-        # weak stemmatization
-        wtok = ChatTokenization() 
-        weak_stemmed_input_text = list(map(lambda string: ' '.join(wtok.tokenizer(string)), input_text))
-        
-        strong_bool_mask = list(map(lambda string: strong_pattern.search(string), strong_stemmed_input_text))
-        weak_bool_mask = list(map(lambda string: weak_pattern.search(string), weak_stemmed_input_text))
-        
-        bool_mask = [bool(s) + bool(w) for s, w in zip(strong_bool_mask, weak_bool_mask)]
+    def analyze(strong_stemmed_text, weak_stemmed_text, strong_pattern, weak_pattern):
+        # a weak match is a whole token equal to a stop word, and every weak
+        # token is also part of the strong string, so a weak match implies a
+        # strong one: the weak search only runs where the strong one hit
+        bool_mask = np.fromiter(
+            (
+                (2 if weak_pattern.search(w) else 1) if strong_pattern.search(s) else 0
+                for s, w in zip(strong_stemmed_text, weak_stemmed_text)
+            ),
+            dtype=np.uint8,
+            count=len(strong_stemmed_text)
+        )
         return bool_mask
     
     @staticmethod
     def concatenate(stop_words):
+        # load_stemmed_words() returns the list cached for the whole process,
+        # so every instance gets its own copy
         stemmed_words = load_stemmed_words()
         if stop_words is None:
-            return stemmed_words
+            return list(stemmed_words)
         
-        tok = ChatTokenization()
+        tok = tokenizer_load()
         stemmed_stop_words = tok.tokenizer(' '.join(stop_words))
         return stemmed_words + stemmed_stop_words
     
     
     @staticmethod
     def get_patterns(stop_words):
-        strong_pattern = '|'.join(stop_words)
+        alternation = RegularExpr._trie_pattern(stop_words)
+        
+        strong_pattern = alternation
         strong_compiled_pattern = re.compile(strong_pattern)
         
-        weak_pattern = r'\b(' + '|'.join(stop_words) + r')\b'
+        weak_pattern = r'\b(' + alternation + r')\b'
         weak_compiled_pattern = re.compile(weak_pattern)
         
         return (strong_compiled_pattern, weak_compiled_pattern)
+    
+    @staticmethod
+    def _trie_pattern(stop_words):
+        # words sharing a prefix are merged into one branch, so the regex
+        # engine tries each prefix once instead of once per word
+        trie = {}
+        for word in stop_words:
+            node = trie
+            for char in word:
+                node = node.setdefault(char, {})
+            node[''] = {}
+        
+        def build(node):
+            branches = [
+                re.escape(char) + build(child)
+                for (char, child) in sorted(node.items()) if char
+            ]
+            if not branches:
+                return ''
+            pattern = branches[0] if len(branches) == 1 else '(?:' + '|'.join(branches) + ')'
+            if '' in node:
+                # a word ends here, the longer continuations are optional
+                pattern = '(?:' + pattern + ')?'
+            return pattern
+        
+        return build(trie)
         
 
+def tokenizer_load():
+    global _DEFAULT_TOK
+    if _DEFAULT_TOK is None:
+        _DEFAULT_TOK = ChatTokenization()
+    return _DEFAULT_TOK
+
+@functools.lru_cache(maxsize=1)
 def vectorizer_load():
-    with resources.path('check_swear.data', 'vectorizer.joblib') as vectorizer_path:
+    vectorizer_file = resources.files('check_swear.data').joinpath('vectorizer.joblib')
+    with resources.as_file(vectorizer_file) as vectorizer_path:
         vectorizer = joblib.load(vectorizer_path)
         return vectorizer
-    
+
+@functools.lru_cache(maxsize=1)
 def model_load():
-    with resources.path('check_swear.data', 'model.joblib') as model_path:
-        model = joblib.load(model_path)
-        return model
\ No newline at end of file
+    # numpy arrays of the model stay memory-mapped instead of being copied
+    model_file = resources.files('check_swear.data').joinpath('model.joblib')
+    with resources.as_file(model_file) as model_path:
+        model = joblib.load(model_path, mmap_mode='r')
+        return model
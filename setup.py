@@ -23,6 +23,7 @@ setup(
         "scikit-learn==1.4.0",
         "joblib==1.3.2",
         "nltk>=3.8.1",
+        "numpy",
     ],
     classifiers=[
         "Programming Language :: Python :: 3.9",